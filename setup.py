@@ -21,7 +21,8 @@ __version__ = get_version()
 
 install_requires = ['web.py', 'psycopg2-binary', 'pandas', 'pyYAML', 'click']
 extras_require = {
-    'all': ['requests']
+    'all': ['requests', 'boto3'],
+    're2': ['google-re2']
 }
 
 setup(
@@ -34,6 +35,7 @@ setup(
     include_package_data=True,
     install_requires=install_requires,
     extras_require=extras_require,
+    python_requires='>=3.10',
     entry_points = {
         'console_scripts': ['validate-fileformat=toolkit.cli:validate_fileformat'],
     }
@@ -1,3 +1,4 @@
+import datetime
 from pathlib import Path
 import pytest
 import pandas as pd
@@ -10,8 +11,25 @@ from toolkit.fileformat import (
     RegexProcessor,
     DatatypeProcessor,
     FileFormatReport,
+    ColumnarErrorList,
     OptionsProcessor)
 
+class TestColumnarErrorList:
+    def test_roundtrip(self):
+        report = FileFormatReport(errors=ColumnarErrorList())
+        report.add_row_error(
+            error_code='invalid-value',
+            error_message="Invalid integer: 'x'",
+            row_index=2,
+            column_name='count',
+            value='x')
+        assert len(report.errors) == 1
+        e = list(report.errors)[0]
+        assert e.row_index == 2
+        assert e.error_code == 'invalid-value'
+        assert report.rejected_row_count == 1
+        assert report.dict()['errors'] == [e.dict()]
+
 class TestUniquenessProcessor:
     def test_success(self):
         c = pd.Series(['a', 'b', 'c'], name='test')
@@ -55,6 +73,17 @@ class TestRegexProcessor:
         assert e.error_code == 'invalid_pattern'
         assert e.error_message == r"The value is not matching the pattern FG\d+: 'X1249'"
 
+    def test_arrow_strings(self):
+        # string columns are converted to arrow-backed strings when
+        # pyarrow is available; the processor must handle that dtype
+        pytest.importorskip("pyarrow")
+        c = pd.Series(['FG10001', 'FG2945', 'X1249'], name='test').astype("string[pyarrow]")
+        p = RegexProcessor(regex=r'FG\d+')
+        report = FileFormatReport()
+        p.process(c, report)
+        assert len(report.errors) == 1
+        assert report.errors[0].row_index == 2
+
 class TestOptionsProcessor:
     def test_success(self):
         c = pd.Series(['Yes', 'No', 'Yes'], name='test')
@@ -92,6 +121,14 @@ class TestDatatypeProcessor:
         assert p.convert_dateformat('YYYY-MM-DD HH:MM:SS') == '%Y-%m-%d %H:%M:%S'
         assert p.convert_dateformat('DD/MM/YYYY') == '%d/%m/%Y'
 
+    def test_to_datetime(self):
+        p = DatatypeProcessor(Datatype.DATETIME, dateformat="DD/MM/YYYY HH:MM:SS")
+        assert p.to_datetime("13/05/2020 10:20:30") == datetime.datetime(2020, 5, 13, 10, 20, 30)
+        with pytest.raises(ValueError):
+            p.to_datetime("13-05-2020 10:20:30")
+        with pytest.raises(ValueError):
+            p.to_datetime("13/0x/2020 10:20:30")
+
     def test_integer_success(self):
         c = pd.Series(['1', '2', '3'], name='test')
         p = DatatypeProcessor(Datatype.INTEGER)
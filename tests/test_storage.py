@@ -0,0 +1,111 @@
+import datetime
+import hashlib
+from pathlib import Path
+from toolkit.storage import StoragePath, _batched, _is_in_sync, _md5_file
+
+def make_path(bucket="test-bucket", path="datasets"):
+    """Creates a StoragePath without touching boto3, like _child does.
+    """
+    p = object.__new__(StoragePath)
+    p.bucket = bucket
+    p.path = path
+    p._dir_prefix = path + "/"
+    p.aws_settings = {}
+    p.s3 = None
+    return p
+
+class TestStoragePath:
+    def test_truediv(self):
+        p = make_path() / "sales" / "2020-05.csv"
+        assert p.path == "datasets/sales/2020-05.csv"
+        assert p.bucket == "test-bucket"
+        assert p._dir_prefix == "datasets/sales/2020-05.csv/"
+
+    def test_joinpath(self):
+        p = make_path().joinpath("sales", "2020-05.csv")
+        assert p.path == "datasets/sales/2020-05.csv"
+
+    def test_name(self):
+        assert (make_path() / "sales" / "2020-05.csv").name == "2020-05.csv"
+        assert make_path().name == "datasets"
+
+    def test_eq(self):
+        assert make_path() / "a" == make_path() / "a"
+        assert make_path() / "a" != make_path() / "b"
+        assert make_path(bucket="other") / "a" != make_path() / "a"
+
+    def test_hash(self):
+        paths = {make_path() / "a", make_path() / "a", make_path() / "b"}
+        assert len(paths) == 2
+
+    def test_md5_hash_from_etag(self):
+        p = make_path() / "a.csv"
+        p.__dict__['_head'] = {'ETag': '"d41d8cd98f00b204e9800998ecf8427e"'}
+        assert p.md5_hash() == "d41d8cd98f00b204e9800998ecf8427e"
+
+    def test_md5_hash_streamed(self):
+        # multipart ETags are 'hash-N', so the contents are hashed
+        p = make_path() / "a.csv"
+        p.__dict__['_head'] = {'ETag': '"abc123-2"'}
+        p.iter_bytes = lambda: iter([b"hello", b" world"])
+        assert p.md5_hash() == hashlib.md5(b"hello world").hexdigest()
+
+    def test_sync_to(self, tmp_path, monkeypatch):
+        p = make_path(path="datasets")
+        entries = [
+            {'Key': 'datasets/a.csv', 'Size': 1, 'ETag': '"x"',
+             'LastModified': datetime.datetime.now(datetime.timezone.utc)},
+            {'Key': 'datasets/sales/b.csv', 'Size': 1, 'ETag': '"y"',
+             'LastModified': datetime.datetime.now(datetime.timezone.utc)},
+        ]
+        p._iterdir_entries = lambda: iter(entries)
+        downloads = []
+        monkeypatch.setattr(StoragePath, "download",
+            lambda self, local_path: downloads.append((self.path, local_path)))
+        p.sync_to(tmp_path)
+        assert sorted(downloads) == [
+            ('datasets/a.csv', str(tmp_path / "a.csv")),
+            ('datasets/sales/b.csv', str(tmp_path / "sales" / "b.csv")),
+        ]
+        assert (tmp_path / "sales").is_dir()
+
+class TestSyncHelpers:
+    def make_entry(self, data, etag=None, age_seconds=0):
+        last_modified = (datetime.datetime.now(datetime.timezone.utc)
+            + datetime.timedelta(seconds=age_seconds))
+        if etag is None:
+            etag = hashlib.md5(data).hexdigest()
+        return {'Size': len(data), 'ETag': f'"{etag}"', 'LastModified': last_modified}
+
+    def test_missing_file(self, tmp_path):
+        entry = self.make_entry(b"hello")
+        assert _is_in_sync(tmp_path / "missing.txt", entry) is False
+
+    def test_size_mismatch(self, tmp_path):
+        f = tmp_path / "a.txt"
+        f.write_bytes(b"hello")
+        entry = self.make_entry(b"hello world")
+        assert _is_in_sync(f, entry) is False
+
+    def test_md5_match(self, tmp_path):
+        f = tmp_path / "a.txt"
+        f.write_bytes(b"hello")
+        assert _is_in_sync(f, self.make_entry(b"hello")) is True
+        assert _is_in_sync(f, self.make_entry(b"hellp")) is False
+
+    def test_multipart_etag_falls_back_to_mtime(self, tmp_path):
+        f = tmp_path / "a.txt"
+        f.write_bytes(b"hello")
+        # remote older than the local file: in sync
+        assert _is_in_sync(f, self.make_entry(b"hello", etag="abc-2", age_seconds=-60)) is True
+        # remote newer than the local file: needs a download
+        assert _is_in_sync(f, self.make_entry(b"hello", etag="abc-2", age_seconds=60)) is False
+
+def test_md5_file(tmp_path):
+    f = tmp_path / "a.txt"
+    f.write_bytes(b"hello world")
+    assert _md5_file(f) == hashlib.md5(b"hello world").hexdigest()
+
+def test_batched():
+    assert list(_batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(_batched([], 2)) == []
@@ -7,3 +7,16 @@ from .cache import memoize # noqa
 from .dateutil import relative_date, truncate_date # noqa
 from .signals import Signal # noqa
 from .fileformat import FileFormat # noqa
+from .storage import StoragePath # noqa
+
+__all__ = [
+    'setup_logger', 'get_logger',
+    'lazy_import',
+    'API',
+    'timeit',
+    'memoize',
+    'relative_date', 'truncate_date',
+    'Signal',
+    'FileFormat',
+    'StoragePath',
+]
@@ -8,13 +8,31 @@ from .imports import lazy_import
 
 requests = lazy_import("requests")
 
+_session_cache = {}
+
+def _get_session(base_url):
+    """Returns a shared session for the given base_url.
+
+    Reusing the session keeps the TCP/TLS connections alive across API
+    instances, so repeated requests skip the connection setup cost.
+    """
+    if base_url not in _session_cache:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _session_cache[base_url] = session
+    return _session_cache[base_url]
+
 class API:
     """Utility to work with JSON APIs.
     """
     def __init__(self, base_url, auth=None):
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.auth = self._parse_auth(auth)
+        self.session = _get_session(self.base_url)
+        # the session is shared across instances, so the auth is kept
+        # per instance and passed on each request
+        self.auth = self._parse_auth(auth)
 
     def _parse_auth(self, auth):
         if isinstance(auth, dict) and 'token' in auth:
@@ -35,14 +53,43 @@ class API:
     def delete(self, path, **kwargs):
         """Delete a resource
         """
-        return self.request('POST', path, **kwargs).json()
+        return self.request('DELETE', path, **kwargs).json()
 
     def request(self, method, path, **kwargs):
-        url = self.base_url + path
+        url = f"{self.base_url}{path}"
+        kwargs.setdefault('auth', self.auth)
         response = self.session.request(method, url, **kwargs)
         response.raise_for_status()
         return response
 
+    def endpoint(self, path):
+        """Returns a callable bound to one URL for repeated requests.
+
+        The full URL is prepared once, so hot loops hitting the same
+        endpoint skip the per-call concatenation.
+
+            get_users = api.endpoint("/users")
+            users = get_users().json()
+        """
+        url = f"{self.base_url}{path}"
+        session = self.session
+        auth = self.auth
+        def call(method='GET', **kwargs):
+            kwargs.setdefault('auth', auth)
+            response = session.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response
+        return call
+
+    def close(self):
+        """Drops the session for this base_url from the cache.
+
+        The session itself is not closed since other live API
+        instances may still be using it; it is garbage collected once
+        the last of them goes away.
+        """
+        _session_cache.pop(self.base_url, None)
+
 class BearerAuth:
     def __init__(self, token):
         self.token = token
@@ -8,11 +8,9 @@ import functools
 
 def memoize(f):
     """Memoizes a function, caching its return values for each input.
+
+    This is a thin wrapper over functools.lru_cache with an unbounded
+    cache. The returned function supports cache_info and cache_clear
+    for introspection.
     """
-    cache = {}
-    @functools.wraps(f)
-    def g(*a):
-        if a not in cache:
-            cache[a] = f(*a)
-        return cache[a]
-    return g
+    return functools.lru_cache(maxsize=None)(f)
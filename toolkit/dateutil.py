@@ -3,6 +3,8 @@ from .imports import lazy_import
 
 pd = lazy_import("pandas")
 
+_REL_DATE_RE = re.compile(r"^(date|week|month)([+-]\d+)$")
+
 def truncate_date(date, timescale: str):
     """Truncates a date to nearest week or month.
 
@@ -11,9 +13,12 @@ def truncate_date(date, timescale: str):
 
     :returns: truncated date
     """
-    date = pd.Timestamp(date)
+    # resolve the lazy proxy once so the attribute lookups below
+    # hit the real module instead of going through __getattr__
+    pd_ = pd.load()
+    date = pd_.Timestamp(date)
     if timescale in ['week', 'weekly']:
-        return date - pd.Timedelta(days=date.dayofweek)
+        return date - pd_.Timedelta(days=date.dayofweek)
     elif timescale in ['month', 'monthly']:
         return date.replace(day=1)
     else:
@@ -25,7 +30,7 @@ def relative_date(date_string, reference_date):
     :param date_string: format is (date|week|month)(+|-)(n)
     :param reference_date: the date to find relative date on
     """
-    m = re.match(r"^(date|week|month)([+-]\d+)$", date_string)
+    m = _REL_DATE_RE.match(date_string)
     if not m:
         raise ValueError("Invalid date: ", date_string)
     timescale, n = m.groups()
@@ -36,5 +41,5 @@ def relative_date(date_string, reference_date):
     else:
         step = {"week": "W-MON", "month": "MS", "date": "D"}[timescale]
         freq = "{}{}".format(n, step)
-        date = pd.date_range(reference_date, periods=2, freq=freq)[-1].date()
+        date = pd.load().date_range(reference_date, periods=2, freq=freq)[-1].date()
     return date
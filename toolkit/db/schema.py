@@ -5,7 +5,10 @@ available tables, coulmns and constraints.
 
 This is tested only on postgres db.
 """
+import itertools
+import operator
 from collections import defaultdict
+from contextlib import contextmanager
 from typing import List
 
 class Column:
@@ -32,24 +35,39 @@ class Table:
         - table_name
         - table_type (VIEW, BASE TABLE)
     """
-    def __init__(self, db, table_data):
+    def __init__(self, db, table_data, schema=None):
         self.db = db
+        self.schema = schema
         self.__dict__.update(table_data)
 
     def get_columns(self, **filters) -> List[Column]:
         """Returns all columns of the table.
         """
-        rows = self.db.where("information_schema.columns",
-                table_schema=self.table_schema,
-                table_name=self.table_name,
-                **filters)
+        if self.schema is not None:
+            rows = self.schema._get_columns(self.table_schema, self.table_name)
+            rows = [row for row in rows
+                    if all(row[k] == v for k, v in filters.items())]
+        else:
+            rows = self.db.where("information_schema.columns",
+                    table_schema=self.table_schema,
+                    table_name=self.table_name,
+                    **filters)
         return [Column(self, row) for row in rows]
 
     def get_column(self, column_name: str) -> Column:
         """Returns the column with given name.
         """
-        columns = self.get_columns(column_name=column_name)
-        return columns and columns[0] or None
+        if self.schema is not None:
+            rows = self.schema._get_columns(self.table_schema, self.table_name)
+            row = next((r for r in rows if r.column_name == column_name), None)
+        else:
+            rows = self.db.where("information_schema.columns",
+                    table_schema=self.table_schema,
+                    table_name=self.table_name,
+                    column_name=column_name,
+                    limit=1)
+            row = next(iter(rows), None)
+        return Column(self, row) if row is not None else None
 
     def has_column(self, column_name: str) -> bool:
         return self.get_column(column_name) is not None
@@ -57,6 +75,8 @@ class Table:
     def get_indexes(self) -> List[str]:
         """Returns all the indexes of the table.
         """
+        if self.schema is not None:
+            return list(self.schema._get_indexes(self.table_name))
         rows = self.db.where("pg_indexes", tablename=self.table_name, schemaname="public")
         return [row.indexname for row in rows]
 
@@ -89,10 +109,10 @@ class EnumType:
         WHERE n.nspname = 'public'
         ORDER BY t.typname, e.enumsortorder
         """
-        types = defaultdict(list)
-        for row in db.query(q):
-            types[row.enum_name].append(row.enum_value)
-        return [EnumType(name, values) for name, values in types.items()]
+        # the query orders by typname, so each enum comes as one group
+        groups = itertools.groupby(db.query(q), key=operator.attrgetter('enum_name'))
+        return [EnumType(name, [row.enum_value for row in rows])
+                for name, rows in groups]
 
     @classmethod
     def find(cls, db, name):
@@ -104,9 +124,87 @@ class Schema:
     """Database Schema
 
     Provides access tables in the database.
+
+    The column and index metadata is fetched for the whole schema in a
+    single query and cached, so inspecting N tables costs one round trip
+    instead of N. Create a fresh Schema to pick up DDL changes.
     """
     def __init__(self, db):
         self.db = db
+        self._tables_cache = {}
+        self._columns_cache = {}
+        self._indexes_cache = None
+        self._enums_cache = None
+
+    def preload(self, table_schema: str='public'):
+        """Fetches all tables, columns, indexes and enum types in four
+        bulk queries and caches them on this Schema.
+
+        Subsequent calls to get_tables, get_columns, get_indexes and
+        get_enum_types are served from memory without hitting the
+        database. Call clear_cache to pick up DDL changes.
+        """
+        rows = self.db.where("information_schema.tables",
+                table_schema=table_schema)
+        self._tables_cache[table_schema] = list(rows)
+        self._load_columns(table_schema)
+        self._load_indexes()
+        self._enums_cache = EnumType.find_all(self.db)
+
+    def clear_cache(self):
+        """Clears all cached schema metadata.
+        """
+        self._tables_cache = {}
+        self._columns_cache = {}
+        self._indexes_cache = None
+        self._enums_cache = None
+
+    @contextmanager
+    def caching(self, table_schema: str='public'):
+        """Context manager that preloads the schema metadata and clears
+        the caches on exit.
+
+        Usage::
+
+            with schema.caching():
+                for t in schema.get_tables():
+                    t.get_columns()
+        """
+        self.preload(table_schema=table_schema)
+        try:
+            yield self
+        finally:
+            self.clear_cache()
+
+    def _load_columns(self, table_schema):
+        if table_schema not in self._columns_cache:
+            columns = defaultdict(list)
+            rows = self.db.where("information_schema.columns",
+                    table_schema=table_schema)
+            for row in rows:
+                columns[row.table_name].append(row)
+            self._columns_cache[table_schema] = columns
+
+    def _get_columns(self, table_schema, table_name):
+        """Returns the column rows of a table, fetching all columns of
+        the table_schema in one query on first use.
+        """
+        self._load_columns(table_schema)
+        return self._columns_cache[table_schema][table_name]
+
+    def _load_indexes(self):
+        if self._indexes_cache is None:
+            indexes = defaultdict(list)
+            for row in self.db.where("pg_indexes", schemaname="public"):
+                indexes[row.tablename].append(row.indexname)
+            self._indexes_cache = indexes
+
+    def _get_indexes(self, table_name):
+        """Returns the index names of a table, fetching all indexes in
+        one query on first use.
+        """
+        self._load_indexes()
+        return self._indexes_cache[table_name]
 
     def get_tables(self, table_schema: str='public', **filters) -> List[Table]:
         """Returns all tables in the database.
@@ -114,10 +212,14 @@ class Schema:
         :param table_schema: specified the table_schema to list tables in
         :return: list of table objects
         """
-        rows = self.db.where("information_schema.tables",
-                table_schema=table_schema,
-                **filters)
-        return [Table(self.db, row) for row in rows]
+        if table_schema in self._tables_cache:
+            rows = [row for row in self._tables_cache[table_schema]
+                    if all(row[k] == v for k, v in filters.items())]
+        else:
+            rows = self.db.where("information_schema.tables",
+                    table_schema=table_schema,
+                    **filters)
+        return [Table(self.db, row, schema=self) for row in rows]
 
     def get_table(self, table_name: str, table_schema: str="public") -> Table:
         """Returns the table with specified table name.
@@ -126,15 +228,30 @@ class Schema:
         :param table_schema: name of the table schema
         :return: the table object
         """
-        tables = self.get_tables(table_name=table_name, table_schema=table_schema)
-        return tables and tables[0] or None
+        if table_schema in self._tables_cache:
+            row = next((r for r in self._tables_cache[table_schema]
+                        if r.table_name == table_name), None)
+        else:
+            rows = self.db.where("information_schema.tables",
+                    table_schema=table_schema,
+                    table_name=table_name,
+                    limit=1)
+            row = next(iter(rows), None)
+        return Table(self.db, row, schema=self) if row is not None else None
 
     def has_table(self, table_name: str, table_schema: str='public') -> bool:
-        return self.get_table(table_name=table_name, table_schema=table_schema) is not None
+        rows = self.db.query(
+            "SELECT 1 FROM information_schema.tables"
+            " WHERE table_schema=$table_schema AND table_name=$table_name"
+            " LIMIT 1",
+            vars=locals())
+        return bool(list(rows))
 
     def get_enum_types(self) -> List[EnumType]:
         """Returns all the enum types preset in database.
         """
+        if self._enums_cache is not None:
+            return self._enums_cache
         return EnumType.find_all(self.db)
 
     def get_enum_type(self, type_name: str) -> EnumType:
@@ -143,7 +260,18 @@ class Schema:
         return EnumType.find(self.db, type_name)
 
     def has_enum_type(self, type_name: str) -> bool:
-        return self.get_enum_type(type_name) is not None
+        # pg_type also has base types and a row type per table, so the
+        # probe joins pg_enum and checks the schema like find_all does
+        q = """
+        SELECT 1
+        FROM pg_type t
+        JOIN pg_enum e ON t.oid = e.enumtypid
+        JOIN pg_namespace n ON n.oid = t.typnamespace
+        WHERE n.nspname = 'public' AND t.typname = $type_name
+        LIMIT 1
+        """
+        rows = self.db.query(q, vars=locals())
+        return bool(list(rows))
 
     def get_views(self, table_schema: str='public') -> List[Table]:
         """Returns all views in the database.
@@ -158,7 +286,7 @@ class Schema:
         views = []
         for row in rows:
             row['table_type'] = 'VIEW'
-            views.append(Table(self.db, row))
+            views.append(Table(self.db, row, schema=self))
         return views
 
     def get_constraints(self) -> List[str]:
@@ -7,18 +7,28 @@ Utilities for Developers.
 from contextlib import contextmanager
 import time
 
+class Timer:
+    """Holds the time measured by a timeit block.
+    """
+    def __init__(self):
+        self.elapsed = 0.0
+
 @contextmanager
 def timeit(label):
     """Times execution of a block of code.
 
     USAGE:
-        with timeit("importing pandas"):
+        with timeit("importing pandas") as t:
             import pandas
 
     Output:
-        importing pandas: 0.913s
+        importing pandas: 0.913
+
+    The elapsed time in seconds is also available as t.elapsed, so
+    callers can use the measurement without parsing stdout.
     """
-    t0 = time.time()
-    yield
-    t1 = time.time()
-    print("{}: {:.3f}".format(label, t1-t0))
+    timer = Timer()
+    t0 = time.perf_counter()
+    yield timer
+    timer.elapsed = time.perf_counter() - t0
+    print("{}: {:.3f}".format(label, timer.elapsed))
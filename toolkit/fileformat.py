@@ -6,16 +6,25 @@
 """
 from __future__ import annotations
 import csv
-import pandas as pd
-import numpy as np
-import yaml
+import itertools
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 import datetime
-from dataclasses import dataclass, field, asdict, replace as dataclass_replace
+import functools
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 from typing import Any, List
 import logging
 
+from .imports import lazy_import
+
+# pandas and friends are expensive to import; load them lazily so that
+# importing toolkit stays cheap for callers that never process a file
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+yaml = lazy_import("yaml")
+
 logger = logging.getLogger(__name__)
 
 class Datatype(Enum):
@@ -25,7 +34,7 @@ class Datatype(Enum):
     DATE = "date"
     DATETIME = "datetime"
 
-@dataclass
+@dataclass(slots=True)
 class ColumnFormat:
     name: str
     label: str
@@ -78,6 +87,73 @@ class ColumnFormat:
         # All other processing happens before the datatype conversion.
         yield DatatypeProcessor(self.datatype, dateformat=self.dateformat)
 
+    def process_fused(self, column: pd.Series, report: FileFormatReport) -> pd.Series:
+        """Processes the column with all checks fused into a single pass.
+
+        This is functionally equivalent to running the processors one by
+        one, but applies every check and the datatype conversion in one
+        loop over the values. The vectorized processors win on large
+        columns; for files with many small columns the fused pass avoids
+        the fixed cost of several column-wide operations. Enabled with
+        the ``fused`` fileformat option.
+
+        Note that errors are reported in row order here, while the
+        processor pipeline reports them grouped by check.
+        """
+        dp = DatatypeProcessor(self.datatype, dateformat=self.dateformat)
+        convert, missing_const, dtype, bad_value_message = _SCALAR_CONVERTERS[self.datatype](dp)
+        pattern = re.compile(self.regex) if self.datatype == Datatype.STRING and self.regex else None
+        allowed = frozenset(self.options) if self.options is not None else None
+        missing_values = frozenset(self.missing_values or []) | {''}
+        seen = set() if self.unique else None
+        invalid_pattern_message = self.regex and 'The value is not matching the pattern {}: {{!r}}'.format(self.regex)
+
+        name = column.name
+        values = []
+        errors = []
+        def add_error(i, value, error_code, error_message):
+            errors.append(FileFormatError(
+                error_level=FileErrorLevel.ROW,
+                error_code=error_code,
+                error_message=error_message,
+                row_index=i,
+                column_name=name,
+                value=value))
+
+        for i, value in column.items():
+            missing = _is_missing(value)
+            if not missing:
+                if seen is not None:
+                    if value in seen:
+                        add_error(i, value, 'duplicate_value',
+                            'Found duplicate value: {!r}'.format(value))
+                    else:
+                        seen.add(value)
+                if pattern is not None and not pattern.match(value):
+                    add_error(i, value, 'invalid_pattern',
+                        invalid_pattern_message.format(value))
+                if allowed is not None and value not in allowed:
+                    add_error(i, value, 'invalid_value',
+                        'The value is not one of the allowed options: {!r}'.format(value))
+            if self.required:
+                if missing:
+                    add_error(i, value, 'missing_value',
+                        'Found missing value: {!r}'.format(value))
+            elif missing or value in missing_values:
+                value = self.default
+                missing = _is_missing(value)
+            if missing:
+                values.append(missing_const)
+            else:
+                try:
+                    values.append(convert(value))
+                except ValueError:
+                    add_error(i, value, 'invalid-value', bad_value_message.format(value))
+                    values.append(missing_const)
+
+        report.add_row_errors(errors)
+        return pd.Series(data=values, index=column.index, name=name, dtype=dtype)
+
     @classmethod
     def from_dict(cls, d):
         fields = cls.get_fields()
@@ -90,40 +166,102 @@ class ColumnFormat:
         params = {k:v for k, v in d.items() if k not in fields}
         return cls(**d1, params=params)
 
+def _is_missing(value):
+    """Tells if a scalar value is treated as missing (None, NaN, NA or '').
+
+    NaN does not compare equal to itself, so membership checks like
+    ``value in [None, np.nan, '']`` miss it; pd.isna handles all the NA
+    flavours. Vectorized paths should use ``column.isna() | column.eq('')``
+    instead — this helper is for the scalar paths only.
+    """
+    return pd.isna(value) or value == ''
+
+def _add_row_errors(report, column, mask, error_code, message_format):
+    """Appends one row error for every True position in the mask.
+
+    The error records are built in a single pass and added to the report
+    in bulk, instead of one add_row_error call per row.
+    """
+    positions = np.flatnonzero(mask.to_numpy())
+    if len(positions) == 0:
+        return
+    index = column.index
+    name = column.name
+    report.add_row_errors(
+        FileFormatError(
+            error_level=FileErrorLevel.ROW,
+            error_code=error_code,
+            error_message=message_format.format(column.iat[i]),
+            row_index=index[i],
+            column_name=name,
+            value=column.iat[i])
+        for i in positions)
+
 class UniquenessProcessor:
     """Ensures that all values in a column are unique.
     """
     def process(self, column: pd.Series, report: FileFormatReport) -> pd.Series:
-        dups = column[column.duplicated()]
-        for i, value in dups.iteritems():
-            report.add_row_error(
-                error_code='duplicate_value',
-                error_message='Found duplicate value: {!r}'.format(value),
-                row_index=i,
-                column_name=column.name,
-                value=value)
+        # duplicated() finds the duplicates in a single vectorized pass,
+        # so only the bad rows are visited to build error records.
+        duplicated = column.duplicated()
+        if not duplicated.any():
+            return column
+        mask = duplicated & column.notna()
+        _add_row_errors(report, column, mask,
+            error_code='duplicate_value',
+            message_format='Found duplicate value: {!r}')
         return column
 
+def _compile_re2(regex):
+    """Compiles the regex with google-re2 when it is installed.
+
+    re2 matches in linear time, so user-supplied patterns cannot trigger
+    the catastrophic backtracking that stdlib re is prone to. Returns
+    None when re2 is unavailable or does not support the pattern.
+    """
+    try:
+        import re2
+    except ImportError:
+        return None
+    try:
+        return re2.compile(regex)
+    except Exception:
+        return None
+
 class RegexProcessor:
     """Ensures that all values in a column match the given regular expression.
     """
     def __init__(self, regex):
         self.regex = regex
+        self._re2 = _compile_re2(regex)
+        self._message_format = 'The value is not matching the pattern {}: {{!r}}'.format(regex)
 
     def process(self, column: pd.Series, report: FileFormatReport) -> pd.Series:
-        rx = re.compile(self.regex)
-        for i, value in column.iteritems():
-            if value is None or value is np.nan:
-                continue
-            if not rx.match(value):
-                report.add_row_error(
-                    error_code='invalid_pattern',
-                    error_message='The value is not matching the pattern {}: {!r}'.format(self.regex, value),
-                    row_index=i,
-                    column_name=column.name,
-                    value=value)
+        if self._re2 is not None:
+            # str.match only takes stdlib patterns, so the re2 matcher
+            # is applied per value via map
+            match = self._re2.match
+            mask = column.map(lambda v: not pd.isna(v) and match(v) is None)
+        else:
+            # str.match applies the pattern over the whole column at
+            # once; missing values are skipped via the notna mask. The
+            # pattern is passed as a string since arrow-backed string
+            # columns don't accept precompiled patterns; pandas caches
+            # the compilation internally.
+            mask = column.notna() & ~column.str.match(self.regex, na=True)
+        _add_row_errors(report, column, mask,
+            error_code='invalid_pattern',
+            message_format=self._message_format)
         return column
 
+_DATATYPE_PROCESS_METHODS = {
+    Datatype.INTEGER: 'process_integer',
+    Datatype.FLOAT: 'process_float',
+    Datatype.DATE: 'process_date',
+    Datatype.DATETIME: 'process_datetime',
+    Datatype.STRING: 'process_string',
+}
+
 class DatatypeProcessor:
     """Processor to convert the input column of strings into the required type.
     """
@@ -131,56 +269,72 @@ class DatatypeProcessor:
         self.datatype = datatype
         self.dateformat_given = dateformat
         self.dateformat = dateformat and self.convert_dateformat(dateformat)
+        self._fast_parse = self.dateformat and _make_fast_parser(self.dateformat)
+        self._process_column = getattr(self, _DATATYPE_PROCESS_METHODS[datatype])
 
     def process(self, column: pd.Series, report: FileFormatReport) -> pd.Series:
-        datatype_info = {
-            Datatype.INTEGER: dict(
-                dtype="Int64", # Int64 supports NAs, and it is different from np.int64
-                missing_value=pd.NA,
-                convert=int,
-                error_message="Invalid integer: {value!r}"),
-            Datatype.FLOAT: dict(
-                dtype=np.float32,
-                missing_value=np.nan,
-                convert=float,
-                error_message="Invalid number: {value!r}"),
-            Datatype.STRING: dict(
-                dtype='str',
-                missing_value=None,
-                convert=str,
-                error_message="Invalid value"),
-            Datatype.DATETIME: dict(
-                dtype='datetime64[ns]',
-                missing_value=np.nan,
-                convert=self.to_datetime,
-                error_message="Invalid timestamp: {value!r}"),
-            Datatype.DATE: dict(
-                dtype='str',
-                missing_value=None,
-                convert=self.to_date,
-                error_message="Invalid date: {value!r}"),
-        }
-        info = datatype_info[self.datatype]
-        def convert(i, value):
-            if value is pd.NA or value in [None, np.nan, '']:
-                return info['missing_value']
-            try:
-                return info['convert'](value)
-            except ValueError:
-                report.add_row_error(
-                    error_code='invalid-value',
-                    error_message=info['error_message'].format(value=value),
-                    row_index=i,
-                    column_name=column.name,
-                    value=value)
-                return info['missing_value']
-
-        values = [convert(i, value) for i, value in column.iteritems()]
-        return pd.Series(data=values, index=column.index, name=column.name, dtype=info['dtype'])
+        return self._process_column(column, report)
+
+    def process_integer(self, column: pd.Series, report: FileFormatReport) -> pd.Series:
+        """Converts a column of strings into integers using the vectorized
+        pandas parser instead of calling int() on every cell.
+        """
+        out = pd.to_numeric(column, errors='coerce')
+        bad = out.isna() & column.notna() & column.ne('')
+        # values like '1.5' parse as numbers, but are not valid integers
+        bad |= out.notna() & (out % 1 != 0)
+        _add_row_errors(report, column, bad,
+            error_code='invalid-value',
+            message_format="Invalid integer: {!r}")
+        # Int64 supports NAs, and it is different from np.int64
+        return out.mask(bad).astype('Int64')
+
+    def process_float(self, column: pd.Series, report: FileFormatReport) -> pd.Series:
+        """Converts a column of strings into floats using the vectorized
+        pandas parser.
+        """
+        out = pd.to_numeric(column, errors='coerce')
+        bad = out.isna() & column.notna() & column.ne('')
+        _add_row_errors(report, column, bad,
+            error_code='invalid-value',
+            message_format="Invalid number: {!r}")
+        return out.astype(np.float32, copy=False)
+
+    def process_date(self, column: pd.Series, report: FileFormatReport) -> pd.Series:
+        """Converts a column of date strings into ISO format dates using
+        the vectorized pandas datetime parser.
+        """
+        parsed = pd.to_datetime(column, format=self.dateformat, errors='coerce')
+        bad = parsed.isna() & column.notna() & column.ne('')
+        _add_row_errors(report, column, bad,
+            error_code='invalid-value',
+            message_format="Invalid date: {!r}")
+        values = np.where(parsed.isna(), None, parsed.dt.strftime('%Y-%m-%d'))
+        return pd.Series(data=values, index=column.index, name=column.name, dtype='str')
+
+    def process_datetime(self, column: pd.Series, report: FileFormatReport) -> pd.Series:
+        """Converts a column of timestamp strings into datetimes using
+        the vectorized pandas datetime parser.
+        """
+        parsed = pd.to_datetime(column, format=self.dateformat, errors='coerce')
+        bad = parsed.isna() & column.notna() & column.ne('')
+        _add_row_errors(report, column, bad,
+            error_code='invalid-value',
+            message_format="Invalid timestamp: {!r}")
+        return parsed
+
+    def process_string(self, column: pd.Series, report: FileFormatReport) -> pd.Series:
+        """Normalizes a string column, replacing missing values with None.
+        """
+        values = np.where(column.isna() | (column == ''), None, column)
+        return pd.Series(data=values, index=column.index, name=column.name, dtype='str')
 
     def to_datetime(self, value: str) -> datetime.datetime:
-        dateformat = self.dateformat
-        return value and datetime.datetime.strptime(value, dateformat)
+        if not value:
+            return value
+        if self._fast_parse is not None:
+            return self._fast_parse(value)
+        return datetime.datetime.strptime(value, self.dateformat)
 
     def to_date(self, value: str) -> str:
         return self.to_datetime(value).date().isoformat()
@@ -188,37 +342,100 @@ class DatatypeProcessor:
     def convert_dateformat(self, dateformat):
         """Converts the the dateformat as expected by datetime.
         """
-        mapping = {
-            ":MM": ":%M", # for minutes
-            "DD": "%d",
-            "MM": "%m",
-            "YYYY": "%Y",
-            "YY": "%y",
-            "HH": "%H",
-            "SS": "%S"
-        }
-        return re.sub("(HH|:MM|SS|YYYY|YY|MM|DD)",
-            lambda m: mapping[m.group()],
-            dateformat)
+        return _convert_dateformat(dateformat)
+
+_DATEFORMAT_MAP = {
+    ":MM": ":%M", # for minutes
+    "DD": "%d",
+    "MM": "%m",
+    "YYYY": "%Y",
+    "YY": "%y",
+    "HH": "%H",
+    "SS": "%S"
+}
+
+# strftime tokens that a specialized parser can handle, with their
+# fixed widths and the corresponding datetime constructor arguments
+_FIXED_WIDTH_TOKENS = {
+    "%Y": ("year", 4),
+    "%m": ("month", 2),
+    "%d": ("day", 2),
+    "%H": ("hour", 2),
+    "%M": ("minute", 2),
+    "%S": ("second", 2),
+}
+
+@functools.lru_cache(maxsize=128)
+def _make_fast_parser(dateformat):
+    """Builds a specialized parser for fixed-width numeric dateformats.
+
+    Parsing with integer slices is typically 5-10x faster than
+    datetime.strptime. Returns None when the format has tokens that
+    need the full strptime machinery.
+    """
+    fields = []   # (field-name, start, end)
+    literals = [] # (position, expected character)
+    pos = 0
+    i = 0
+    while i < len(dateformat):
+        if dateformat[i] == '%':
+            token = dateformat[i:i+2]
+            if token not in _FIXED_WIDTH_TOKENS:
+                return None
+            name, width = _FIXED_WIDTH_TOKENS[token]
+            fields.append((name, pos, pos+width))
+            pos += width
+            i += 2
+        else:
+            literals.append((pos, dateformat[i]))
+            pos += 1
+            i += 1
+    length = pos
+
+    def parse(value):
+        if len(value) != length:
+            raise ValueError("Invalid date: {!r}".format(value))
+        for p, c in literals:
+            if value[p] != c:
+                raise ValueError("Invalid date: {!r}".format(value))
+        parts = {name: int(value[a:b]) for name, a, b in fields}
+        return datetime.datetime(
+            parts.get('year', 1900), parts.get('month', 1), parts.get('day', 1),
+            parts.get('hour', 0), parts.get('minute', 0), parts.get('second', 0))
+
+    return parse
+
+_DATEFORMAT_TOKENS = re.compile("(HH|:MM|SS|YYYY|YY|MM|DD)")
+
+@functools.lru_cache(maxsize=128)
+def _convert_dateformat(dateformat):
+    return _DATEFORMAT_TOKENS.sub(
+        lambda m: _DATEFORMAT_MAP[m.group()],
+        dateformat)
+
+# scalar converters used by ColumnFormat.process_fused, keyed by datatype
+_SCALAR_CONVERTERS = {
+    Datatype.INTEGER: lambda dp: (int, pd.NA, 'Int64', "Invalid integer: {!r}"),
+    Datatype.FLOAT: lambda dp: (float, np.nan, 'float32', "Invalid number: {!r}"),
+    Datatype.STRING: lambda dp: (str, None, 'str', "Invalid value"),
+    Datatype.DATE: lambda dp: (dp.to_date, None, 'str', "Invalid date: {!r}"),
+    Datatype.DATETIME: lambda dp: (dp.to_datetime, np.nan, 'datetime64[ns]', "Invalid timestamp: {!r}"),
+}
 
 class OptionsProcessor:
     def __init__(self, options):
         self.options = options
+        self._allowed = frozenset(options)
 
     def process(self, column, report) -> pd.Series:
         """Ensures that every value in the column is present the options.
         """
-        for i, value in column.iteritems():
-            # will be handled by missing-value validator
-            if value is None or value == "":
-                continue
-            if value not in self.options:
-                report.add_row_error(
-                    error_code='invalid_value',
-                    error_message='The value is not one of the allowed options: {!r}'.format(value),
-                    row_index=i,
-                    column_name=column.name,
-                    value=value)
+        # missing values will be handled by the missing-value validator
+        present = column.notna() & column.ne("")
+        mask = present & ~column.isin(self._allowed)
+        _add_row_errors(report, column, mask,
+            error_code='invalid_value',
+            message_format='The value is not one of the allowed options: {!r}')
         return column
 
 class RequiredProcessor:
@@ -227,15 +444,11 @@ class RequiredProcessor:
     This must be called before converting the datatype of the column.
     """
     def process(self, column, report) -> pd.Series:
-        missing_values = ['', np.nan, None]
-        missing = column[column.isin(missing_values)]
-        for i, value in missing.iteritems():
-            report.add_row_error(
-                error_code='missing_value',
-                error_message='Found missing value: {!r}'.format(value),
-                row_index=i,
-                column_name=column.name,
-                value=value)
+        # isna() catches None and NaN reliably, unlike an equality check
+        missing = column.isna() | column.eq('')
+        _add_row_errors(report, column, missing,
+            error_code='missing_value',
+            message_format='Found missing value: {!r}')
         return column
 
 class DefaultsProcessor:
@@ -244,18 +457,34 @@ class DefaultsProcessor:
     def __init__(self, default_value, missing_values=None):
         self.default_value = default_value
         self.missing_values = missing_values
+        self._missing = frozenset(missing_values or []) | {''}
 
     def process(self, column, report) -> pd.Series:
-        missing_values = ['', np.nan, None]
-        if self.missing_values:
-            missing_values += self.missing_values
-        return column.replace({v: self.default_value for v in missing_values})
+        # isna() catches None/NaN, which a replace dict keyed on np.nan
+        # does not match reliably
+        mask = column.isna() | column.isin(self._missing)
+        return column.mask(mask, self.default_value)
+
+@functools.lru_cache(maxsize=1)
+def _arrow_strings_available():
+    try:
+        import pyarrow # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+# thresholds below which per-column processing stays serial, so that
+# small files don't pay the thread-pool setup cost
+_PARALLEL_MIN_COLUMNS = 8
+_PARALLEL_MIN_ROWS = 10000
 
 ROW_VALIDATORS = {}
 
 def row_validator(name=None):
     """Registers a row validator with given name.
 
+    The row is passed as a namedtuple with the column names as fields.
+
     Usage::
 
         >>> @row_validator("something")
@@ -284,6 +513,11 @@ class FileFormat:
         self.columns = columns
         self.options = options or {}
         self.begin_row_index = self.options.get("skiprows", 0) + 1
+        # hoist the per-file invariants out of _process
+        self._expected_column_names = [c.label for c in columns]
+        self._expected_column_set = set(self._expected_column_names)
+        self._validator_funcs = [ROW_VALIDATORS[v]
+            for v in self.options.get("validators") or []]
 
     def __repr__(self):
         return f"<FileFormat:{self.name}>"
@@ -301,31 +535,66 @@ class FileFormat:
         return report.with_filename(filename)
 
     def read_csv(self, filename, skiprows=0):
-        data = list(csv.reader(open(filename, encoding='ascii', errors='ignore')))
-        data = data[skiprows:]
-        ncols = max(len(row) for row in data)
-        columns = data[0]
-        d = data[1:]
+        # process_file passes options.get("skiprows"), which is None
+        # when the option is not set
+        skiprows = skiprows or 0
+        if _arrow_strings_available() and not self.options.get("repeat_last_column"):
+            try:
+                return self._read_csv_arrow(filename, skiprows=skiprows)
+            except Exception:
+                logger.warning(
+                    "pyarrow failed to read %r, falling back to the python reader",
+                    filename, exc_info=True)
+        # One light pass to find the header and the widest row, so that
+        # ragged files (repeat_last_column) get names for every column.
+        with open(filename, encoding='ascii', errors='ignore') as f:
+            rows = itertools.islice(csv.reader(f), skiprows, None)
+            columns = next(rows)
+            ncols = max((len(row) for row in rows), default=len(columns))
+        ncols = max(ncols, len(columns))
 
         # Add names for additional columns
         columns = columns + [f'_x{i}' for i in range(ncols-len(columns))]
-        d = [self.resize(ncols, row) for row in d]
-        df = pd.DataFrame(d, columns=columns, dtype=str)
-        df = df.replace('', np.nan)
-
-        # XXX-Anand: force all the columns to be str
-        # Temporary hack until we figure out how to specify the dtupe
-        # when creating the dataframe
-        for c in df.columns:
-            ## XXX-Anand: convert only non-null values to str
-            # df[c] = df[c].astype(str)
-            df[c] = np.where(pd.isnull(df[c]), df[c], df[c].astype(str))
-        return df
-
-    def resize(self, n, row):
-        """Fills the row with empty values if the size of row is less than n.
+        # the header is skipped along with skiprows since the names are
+        # passed explicitly; header=0 trips up the C parser on ragged rows
+        return pd.read_csv(filename,
+            skiprows=skiprows+1,
+            header=None,
+            names=columns,
+            index_col=False,
+            dtype=str,
+            keep_default_na=False,
+            na_values=[''],
+            encoding='ascii',
+            encoding_errors='ignore',
+            engine='c')
+
+    def _read_csv_arrow(self, filename, skiprows=0):
+        """Reads the csv file using the multi-threaded pyarrow csv reader.
+
+        All columns are read as strings, keeping the contract that
+        process_data expects. The typed conversion is still done by the
+        DatatypeProcessor so that bad values are reported per row.
         """
-        return row + [''] * (n-len(row))
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+
+        # tolerate skiprows=None so an argument bug can't masquerade as
+        # a pyarrow read failure via the broad fallback in read_csv
+        skiprows = skiprows or 0
+        with open(filename, encoding='ascii', errors='ignore') as f:
+            for _ in range(skiprows):
+                f.readline()
+            header = next(csv.reader(f))
+
+        table = pacsv.read_csv(
+            filename,
+            read_options=pacsv.ReadOptions(skip_rows=skiprows),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=True,
+                null_values=['']))
+        return table.to_pandas()
 
     def process_data(self, df: pd.DataFrame) -> FileFormatReport:
         """Process given dataframe as per the specifications of the
@@ -351,7 +620,7 @@ class FileFormat:
             return report.with_status(FileStatus.REJECTED)
 
     def _process(self, df, report):
-        expected_column_names = [c.label for c in self.columns]
+        expected_column_names = self._expected_column_names
 
         if not self.options.get("ignore_additional_columns") and not self.options.get("repeat_last_column"):
             self.check_additional_columns(df, expected_column_names, report)
@@ -370,43 +639,103 @@ class FileFormat:
             repeat_format = None
 
         df2 = pd.DataFrame(index=df.index)
-        for c in column_formats:
-            df2[c.name] = c.process(df[c.label], report)
+        if self.options.get("fused"):
+            for c in column_formats:
+                df2[c.name] = c.process_fused(self._prepare_column(c, df[c.label]), report)
+        elif len(column_formats) >= _PARALLEL_MIN_COLUMNS and len(df) >= _PARALLEL_MIN_ROWS:
+            self._process_columns_parallel(column_formats, df, df2, report)
+        else:
+            for c in column_formats:
+                df2[c.name] = c.process(self._prepare_column(c, df[c.label]), report)
 
         if repeat_format:
             names = df.columns[len(column_formats):]
             columns = [df[name] for name in names]
             df2[repeat_format.name] = self.process_repeat_columns(repeat_format, columns, report)
 
-        if self.options.get("validators"):
-            self.run_validators(self.options['validators'], df2, report)
+        if self._validator_funcs:
+            self.run_validators(self._validator_funcs, df2, report)
 
         if report.errors and self.options.get("on_error") == "reject-file":
             return report.with_status(status=FileStatus.REJECTED)
 
         rejected_rows = {e.row_index for e in report.errors
                         if e.error_level==FileErrorLevel.ROW}
-        df2 = df2[~df.index.isin(rejected_rows)]
+        if rejected_rows:
+            df2 = df2[self._keep_rows_mask(df.index, rejected_rows)]
         return report.with_df(df2)
 
+    def _keep_rows_mask(self, index, rejected_rows):
+        """Builds a boolean mask selecting the rows that are not rejected.
+
+        For the common case of a default integer range index the mask is
+        filled with direct position lookups, which avoids the hashing
+        pass of index.isin over every row.
+        """
+        if isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1:
+            mask = np.ones(len(index), dtype=bool)
+            for i in rejected_rows:
+                if 0 <= i < len(index):
+                    mask[i] = False
+            return mask
+        return ~index.isin(rejected_rows)
+
+    def _process_columns_parallel(self, column_formats, df, df2, report):
+        """Processes the columns concurrently using a thread pool.
+
+        The heavy lifting per column happens inside vectorized pandas
+        calls, so threads give a good speedup without the pickling cost
+        of a process pool. Each column collects errors into its own
+        report and those are merged in column order, so the resulting
+        error order matches the serial path.
+        """
+        def process_column(c):
+            subreport = FileFormatReport(total_rows=report.total_rows)
+            column = c.process(self._prepare_column(c, df[c.label]), subreport)
+            return column, subreport
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(process_column, column_formats))
+
+        for c, (column, subreport) in zip(column_formats, results):
+            df2[c.name] = column
+            report.add_row_errors(subreport.errors)
+
+    def _prepare_column(self, column_format: ColumnFormat, column: pd.Series) -> pd.Series:
+        """Converts text columns to arrow-backed strings when pyarrow is
+        available.
+
+        The arrow string arrays use a lot less memory than object arrays
+        and speed up the string operations in the processors.
+        """
+        if column_format.datatype == Datatype.STRING and _arrow_strings_available():
+            try:
+                return column.astype("string[pyarrow]")
+            except (TypeError, ValueError):
+                return column
+        return column
+
     def process_repeat_columns(self,
             column_format: ColumnFormat,
             columns: List[pd.Series],
             report: FileFormatReport) -> pd.Series:
         columns = [column_format.process(c, report) for c in columns]
-        def notnull(row):
-            return [x for x in row if x and x is not np.nan]
-        d = [notnull(row) for row in zip(*columns)]
-        return pd.Series(d)
-
-    def run_validators(self, validators, df, report):
-        for i, row in df.iterrows():
-            for v in validators:
-                vfunc = ROW_VALIDATORS[v]
-                vfunc(i, row, report)
+        # one vectorized mask over all repeat columns; the comprehension
+        # below only gathers the already-filtered cells per row
+        arr = np.column_stack([c.to_numpy(dtype=object) for c in columns])
+        mask = pd.notna(arr) & (arr != '')
+        data = [list(arr[i, mask[i]]) for i in range(arr.shape[0])]
+        return pd.Series(data, index=columns[0].index)
+
+    def run_validators(self, vfuncs, df, report):
+        # itertuples yields lightweight namedtuples instead of building
+        # a Series per row like iterrows does
+        for row in df.itertuples(name='Row'):
+            for vfunc in vfuncs:
+                vfunc(row.Index, row, report)
 
     def check_additional_columns(self, df, expected_column_names, report):
-        names = set(expected_column_names)
+        names = self._expected_column_set
         extra_columns = [c for c in df.columns if c not in names]
         if extra_columns:
             report.add_file_error(
@@ -455,7 +784,7 @@ class FileErrorLevel(str, Enum):
     ROW = "row"
     FILE = "file"
 
-@dataclass
+@dataclass(slots=True)
 class FileFormatError:
     error_level: FileErrorLevel
     error_code: str
@@ -477,7 +806,56 @@ class FileFormatError:
         else:
             return "[{}#{}] {}:{}".format(self.column_name, self.row_index, self.error_code, self.error_message)
 
-@dataclass
+class ColumnarErrorList:
+    """Memory-efficient store for FileFormatError records.
+
+    Keeps the error fields in parallel lists instead of one dataclass
+    instance per error, which takes a fraction of the memory when
+    millions of cells fail. The error objects are materialized lazily
+    on iteration. Opt in by passing an instance as the errors field::
+
+        report = FileFormatReport(errors=ColumnarErrorList())
+    """
+    __slots__ = ('_levels', '_codes', '_messages', '_row_indexes', '_columns', '_values')
+
+    def __init__(self):
+        self._levels = []
+        self._codes = []
+        self._messages = []
+        self._row_indexes = []
+        self._columns = []
+        self._values = []
+
+    def append(self, error: FileFormatError):
+        self._levels.append(error.error_level)
+        self._codes.append(error.error_code)
+        self._messages.append(error.error_message)
+        self._row_indexes.append(error.row_index)
+        self._columns.append(error.column_name)
+        self._values.append(error.value)
+
+    def extend(self, errors):
+        for e in errors:
+            self.append(e)
+
+    def row_indexes(self):
+        """Returns the row_index of every row-level error.
+        """
+        return [i for level, i in zip(self._levels, self._row_indexes)
+                if level == FileErrorLevel.ROW]
+
+    def __len__(self):
+        return len(self._levels)
+
+    def __iter__(self):
+        fields = zip(self._levels, self._codes, self._messages,
+                     self._row_indexes, self._columns, self._values)
+        return (FileFormatError(*f) for f in fields)
+
+    def __repr__(self):
+        return "<ColumnarErrorList: #errors={}>".format(len(self))
+
+@dataclass(slots=True)
 class FileFormatReport:
     """Report of processing a file using a fileformat.
     """
@@ -493,21 +871,29 @@ class FileFormatReport:
 
     @property
     def rejected_row_count(self):
+        if isinstance(self.errors, ColumnarErrorList):
+            return len(set(self.errors.row_indexes()))
         return len(set(e.row_index for e in self.errors if e.error_level == FileErrorLevel.ROW))
 
     def __repr__(self):
         return "<Report:status={} #errors={}>".format(self.status, len(self.errors))
 
     def with_filename(self, filename):
-        return dataclass_replace(self, filename=filename)
+        self.filename = filename
+        return self
 
     def with_status(self, status):
-        """Sets the status in a copy of the report and returns it.
+        """Sets the status on the report and returns it.
+
+        The report is updated in place; copying it would shallow-copy
+        the errors list and the df on every with_* call in the chain.
         """
-        return dataclass_replace(self, status=status)
+        self.status = status
+        return self
 
     def with_df(self, df):
-        return dataclass_replace(self, df=df)
+        self.df = df
+        return self
 
     def add_file_error(self, error_code, error_message):
         e = FileFormatError(
@@ -526,9 +912,16 @@ class FileFormatReport:
             value=value)
         self.errors.append(e)
 
+    def add_row_errors(self, errors):
+        """Adds multiple errors to the report in one go.
+        """
+        self.errors.extend(errors)
+
     def dict(self):
         d = asdict(self)
         d.pop('df', None) # Delete df from the report
+        if not isinstance(self.errors, list):
+            d['errors'] = [e.dict() for e in self.errors]
         return d
 
     def is_file_accepted(self):
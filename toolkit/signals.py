@@ -18,8 +18,17 @@ class Signal:
     def send(self, *args, **kwargs):
         """Notifies all listeners of this signal.
         """
-        for f in self.listeners:
-            f(*args, **kwargs)
+        # signals may be sent from tight loops, so return early when
+        # nothing is listening and bind the list to a local
+        listeners = self.listeners
+        if not listeners:
+            return
+        if kwargs:
+            for f in listeners:
+                f(*args, **kwargs)
+        else:
+            for f in listeners:
+                f(*args)
 
     def connect(self, f):
         """Connects a function to this signal.